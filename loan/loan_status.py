@@ -1,9 +1,8 @@
-from dataclasses import dataclass
 from datetime import datetime
+from typing import NamedTuple
 
 
-@dataclass
-class LoanStatus:
+class LoanStatus(NamedTuple):
     date: datetime.date
     balance: float
     interest: float
@@ -1,5 +1,7 @@
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
+from functools import cached_property
 import plotly.graph_objects as go
 
 from .property_loan import PropertyLoan
@@ -19,44 +21,66 @@ class IncomeAdjustedPropertyLoan(PropertyLoan):
     agi_usd: float
     itemized_deductions_usd: float
 
-    @property
+    def __post_init__(self):
+        super().__post_init__()
+        self._has_tax_inputs = self.agi_usd > 0 or self.itemized_deductions_usd > 0
+        self._payment_columns = tuple(
+            col for col in self.PAYMENT_COLUMN_MAPPINGS
+            if (
+                col != 'estimated_appreciation_effective_mortgage_decrease'
+                or self.include_appreciation_as_reduction
+            )
+            and (col != 'estimated_tax_savings' or self._has_tax_inputs)
+        )
+
+    @cached_property
     def dataframe_yearly(self) -> pd.DataFrame:
         df = super().dataframe_yearly
-        df['agi'] = self.agi_usd
-        df['total_itemized_deductions'] = df['interest'] + self.itemized_deductions_usd
-        df['standard_deduction'] = self.STANDARD_DEDUCTION
-        df['maximum_deduction'] = df[['total_itemized_deductions', 'standard_deduction']].max(axis=1)
-        df['agi_reduced'] = df['agi'] - df['maximum_deduction']
-        df['estimated_tax_savings'] = -0.4 * df['maximum_deduction']
+        if self._has_tax_inputs:
+            total_itemized_deductions = df['interest'].to_numpy() + self.itemized_deductions_usd
+            maximum_deduction = np.maximum(total_itemized_deductions, self.STANDARD_DEDUCTION)
+            df['agi'] = self.agi_usd
+            df['total_itemized_deductions'] = total_itemized_deductions
+            df['maximum_deduction'] = maximum_deduction
+            df['agi_reduced'] = self.agi_usd - maximum_deduction
+            df['estimated_tax_savings'] = -0.4 * maximum_deduction
         if self.include_appreciation_as_reduction:
             df['estimated_appreciation_effective_mortgage_decrease'] = - self.appreciation_effective_mortgage_decrease
-        existing_payment_columns = list(self.PAYMENT_COLUMN_MAPPINGS.keys() & set(df.columns))
-        df['total'] = df[existing_payment_columns].sum(axis=1)
+        df['total'] = df[list(self._payment_columns)].to_numpy(dtype=np.float64).sum(axis=1)
         return df
 
     def graph_yearly(self) -> go.Figure:
-        fig = super().graph_yearly()
         df = self.dataframe_yearly
-        fig.add_trace(go.Line(
+        traces = self._make_traces_from_df(df)
+        traces.append(dict(
+            type='scattergl',
+            mode='lines',
             name='Net',
-            x=df.index,
-            y=df['total'],
+            x=traces[0]['x'],
+            y=df['total'].to_numpy(),
         ))
-        return fig
+        return self._make_graph_from_traces(traces)
 
     def appreciation_multiplier_at_year(self, year: float):
         return (1 + self.home_appreciation_percentage) ** year
 
-    @property
+    @cached_property
+    def appreciation_multipliers(self) -> np.ndarray:
+        return np.power(
+            1 + self.home_appreciation_percentage,
+            np.arange(self.mortgage_years + 1),
+        )
+
+    @cached_property
     def final_value(self):
-        multiplier = self.appreciation_multiplier_at_year(self.mortgage_years)
+        multiplier = self.appreciation_multipliers[-1]
         final_value = multiplier * self.purchase_price
         return final_value
 
-    @property
+    @cached_property
     def anticipated_profit(self):
         return self.final_value - self.purchase_price
 
-    @property
+    @cached_property
     def appreciation_effective_mortgage_decrease(self):
         return self.anticipated_profit / (self.mortgage_years * self.MONTHS_PER_YEAR)
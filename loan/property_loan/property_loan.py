@@ -1,22 +1,56 @@
+import math
+from functools import cached_property
+import numpy as np
 import pandas as pd
 from typing import Iterable
 
 from dataclasses import dataclass
 import datetime
 from dateutil.relativedelta import relativedelta
+import numba
 import plotly.graph_objects as go
 
 from ..loan_status import LoanStatus
 
 
+# float32 would halve the schedule's memory traffic and is precise enough for
+# dollar amounts, but a single loan is only a few hundred rows; revisit if the
+# model ever computes schedules in bulk (e.g. parameter sweeps).
+_SCHEDULE_DTYPE = np.float64
+
+
+def _relativedelta_to_offset(interval: relativedelta) -> pd.DateOffset:
+    return pd.DateOffset(
+        years=interval.years,
+        months=interval.months,
+        days=interval.days,
+    )
+
+
+@numba.njit(cache=True)
+def _amortize(loan_amount, monthly_rate, monthly_payment, num_payments):
+    balance = np.empty(num_payments + 1)
+    interest = np.empty(num_payments + 1)
+    principal = np.empty(num_payments + 1)
+    months_balance = loan_amount
+    for month in range(num_payments + 1):
+        months_interest = months_balance * monthly_rate
+        months_principal = (monthly_payment - months_interest) if months_balance > 0 else 0.0
+        balance[month] = months_balance
+        interest[month] = months_interest
+        principal[month] = months_principal
+        months_balance = max(months_balance - months_principal, 0.0)
+    return balance, interest, principal
+
+
 @dataclass(kw_only=True)
 class PropertyLoan:
     MONTHS_PER_YEAR = 12
     YEARLY_AGGREGATIONS = dict(
-        balance='max',
-        interest='sum',
-        principal='sum',
-        taxes='sum',
+        balance=np.maximum,
+        interest=np.add,
+        principal=np.add,
+        taxes=np.add,
     )
     PAYMENT_COLUMN_MAPPINGS = dict(
         interest='Interest',
@@ -33,12 +67,18 @@ class PropertyLoan:
     include_appreciation_as_reduction: bool = True
     payment_interval: relativedelta = relativedelta(months=1)
 
-    @property
+    def __post_init__(self):
+        self._monthly_rate = self.interest_rate_percentage / self.MONTHS_PER_YEAR
+        self._monthly_payment = self.mortgage_per_month_usd
+
+    @cached_property
     def loan_amount_usd(self):
         return self.purchase_price * (1 - self.down_payment_percentage)
 
-    @property
+    @cached_property
     def mortgage_per_year_usd(self) -> float:
+        if self.interest_rate_percentage == 0:
+            return self.loan_amount_usd / self.mortgage_years
         numerator = (1 + self.interest_rate_percentage) ** self.mortgage_years
         denomenator = numerator - 1
         result = self.loan_amount_usd
@@ -47,7 +87,7 @@ class PropertyLoan:
         result /= denomenator
         return result
 
-    @property
+    @cached_property
     def mortgage_per_month_usd(self) -> float:
         return self.mortgage_per_year_usd / self.MONTHS_PER_YEAR
 
@@ -55,18 +95,19 @@ class PropertyLoan:
             self,
             balance_usd: float,
     ) -> float:
-        return (balance_usd * self.interest_rate_percentage) / self.MONTHS_PER_YEAR
+        return balance_usd * self._monthly_rate
 
     def calculate_monthly_principal(
             self,
             interest_usd: float,
             balance_usd: float
     ) -> float:
-        return (self.mortgage_per_month_usd - interest_usd) * (balance_usd > 0)
+        return (self._monthly_payment - interest_usd) * (balance_usd > 0)
 
     def calculate_next_loan_status(
             self,
-            loan_status: LoanStatus
+            loan_status: LoanStatus,
+            next_date=None,
     ) -> LoanStatus:
         next_months_balance = max(loan_status.balance - loan_status.principal, 0)
         next_months_interest = self.calculate_monthly_interest(
@@ -77,7 +118,7 @@ class PropertyLoan:
             balance_usd=next_months_balance
         )
         next_loan_status = LoanStatus(
-            date=loan_status.date + self.payment_interval,
+            date=next_date if next_date is not None else loan_status.date + self.payment_interval,
             balance=next_months_balance,
             interest=next_months_interest,
             principal=next_months_principal,
@@ -104,53 +145,129 @@ class PropertyLoan:
         return initial_loan_status
 
     def __iter__(self) -> Iterable[LoanStatus]:
-        loan_status = self.initial_loan_status
-        yield loan_status
-        while loan_status.balance > 0:
-            loan_status = self.calculate_next_loan_status(loan_status)
-            yield loan_status
+        schedule = self._schedule_arrays
+        dates = self._payment_dates(len(schedule['balance']))
+        for row in zip(
+                dates,
+                schedule['balance'],
+                schedule['interest'],
+                schedule['principal'],
+                schedule['taxes'],
+        ):
+            yield LoanStatus(*row)
 
-    @property
+    def _payment_dates(self, periods: int) -> pd.DatetimeIndex:
+        return pd.date_range(
+            start=datetime.date.today(),
+            periods=periods,
+            freq=_relativedelta_to_offset(self.payment_interval),
+        )
+
+    def _num_payments(self) -> int:
+        monthly_rate = self._monthly_rate
+        monthly_payment = self._monthly_payment
+        if self.loan_amount_usd <= 0:
+            return 0
+        if monthly_rate == 0:
+            return math.ceil(self.loan_amount_usd / monthly_payment)
+        payoff_ratio = monthly_payment / (monthly_payment - self.loan_amount_usd * monthly_rate)
+        return math.ceil(math.log(payoff_ratio, 1 + monthly_rate))
+
+    @cached_property
+    def _schedule_arrays(self) -> dict:
+        monthly_rate = self._monthly_rate
+        monthly_payment = self._monthly_payment
+        num_payments = self._num_payments()
+        if monthly_rate > 0:
+            growth = np.empty(num_payments + 2, dtype=_SCHEDULE_DTYPE)
+            growth[0] = 1.0
+            growth[1:] = 1.0 + monthly_rate
+            np.cumprod(growth, out=growth)
+            raw_balance = (
+                self.loan_amount_usd * growth
+                - monthly_payment * (growth - 1) / monthly_rate
+            )
+            payoff_index = min(np.searchsorted(-raw_balance, 0.0), num_payments + 1)
+            balance = np.maximum(raw_balance[:payoff_index + 1], 0.0)
+            interest = balance * monthly_rate
+            principal = np.where(balance > 0, monthly_payment - interest, 0.0)
+        else:
+            balance, interest, principal = _amortize(
+                self.loan_amount_usd,
+                monthly_rate,
+                monthly_payment,
+                num_payments,
+            )
+        taxes = np.full(len(balance), self.property_taxes_monthly_usd, dtype=_SCHEDULE_DTYPE)
+        return dict(
+            balance=balance,
+            interest=interest,
+            principal=principal,
+            taxes=taxes,
+        )
+
+    @cached_property
     def dataframe(self) -> pd.DataFrame:
-        df = pd.DataFrame(iter(self))
-        df['date'] = pd.to_datetime(df['date'])
+        schedule = self._schedule_arrays
+        dates = self._payment_dates(len(schedule['balance']))
+        df = pd.DataFrame(schedule, index=dates, copy=False)
         return df
 
-    @property
+    @cached_property
     def dataframe_yearly(self) -> pd.DataFrame:
         df = self.dataframe
-        df_by_year = (
-            df
-            .groupby(df['date'].dt.year)
-            .agg(self.YEARLY_AGGREGATIONS)
+        start_date = df.index[0]
+        month_indices = np.arange(len(df))
+        years = start_date.year + (start_date.month - 1 + month_indices) // 12
+        year_starts = np.concatenate(([0], np.flatnonzero(np.diff(years)) + 1))
+        df_by_year = pd.DataFrame(
+            {
+                col: reducer.reduceat(df[col].to_numpy(), year_starts)
+                for col, reducer in self.YEARLY_AGGREGATIONS.items()
+            },
+            index=pd.Index(years[year_starts], name='date'),
         )
         return df_by_year
 
-    @property
+    @cached_property
     def total_interest(self):
-        return self.dataframe['interest'].sum()
+        return self._schedule_arrays['interest'].sum()
 
     @classmethod
-    def _make_graph_from_df(cls, df) -> go.Figure:
-        fig = go.Figure(data=[
-            go.Bar(
-                name=col_title,
-                x=df.index,
-                y=df[col]
+    def _make_traces_from_df(cls, df) -> list:
+        columns = [col for col in cls.PAYMENT_COLUMN_MAPPINGS if col in df.columns]
+        x = df.index.to_numpy()
+        values = df[columns].to_numpy(dtype=np.float64)
+        return [
+            dict(
+                type='bar',
+                name=cls.PAYMENT_COLUMN_MAPPINGS[col],
+                x=x,
+                y=values[:, column_index],
             )
-            for col, col_title
-            in cls.PAYMENT_COLUMN_MAPPINGS.items()
-            if col in df.columns
-        ])
-        fig.update_layout(barmode='relative')
-        return fig
+            for column_index, col in enumerate(columns)
+        ]
+
+    @classmethod
+    def _make_graph_from_traces(cls, traces) -> go.Figure:
+        return go.Figure(
+            {
+                'data': traces,
+                'layout': {'barmode': 'relative'},
+            },
+            skip_invalid=True,
+        )
+
+    @classmethod
+    def _make_graph_from_df(cls, df) -> go.Figure:
+        return cls._make_graph_from_traces(cls._make_traces_from_df(df))
 
     def graph_yearly(self) -> go.Figure:
         return self._make_graph_from_df(self.dataframe_yearly)
 
     def graph_monthly(self) -> go.Figure:
-        return self._make_graph_from_df(self.dataframe.set_index('date'))
+        return self._make_graph_from_df(self.dataframe)
 
-    @property
+    @cached_property
     def property_taxes_monthly_usd(self):
         return self.property_taxes_yearly_usd / self.MONTHS_PER_YEAR
\ No newline at end of file
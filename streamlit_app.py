@@ -1,7 +1,108 @@
+import pandas as pd
+import plotly.graph_objects as go
 import streamlit as st
 
 from streamlit_utils import percentage_input
-from loan import IncomeAdjustedPropertyLoan
+from loan import IncomeAdjustedPropertyLoan, PropertyLoan
+
+
+def build_property_loan(
+        purchase_price,
+        down_payment_percentage,
+        interest_rate_percentage,
+        mortgage_years,
+        property_taxes_yearly_usd,
+        home_appreciation_percentage,
+        include_appreciation_as_reduction,
+        agi_usd,
+        itemized_deductions_usd,
+) -> IncomeAdjustedPropertyLoan:
+    return IncomeAdjustedPropertyLoan(
+        purchase_price=purchase_price,
+        down_payment_percentage=down_payment_percentage,
+        interest_rate_percentage=interest_rate_percentage,
+        mortgage_years=mortgage_years,
+        property_taxes_yearly_usd=property_taxes_yearly_usd,
+        home_appreciation_percentage=home_appreciation_percentage,
+        include_appreciation_as_reduction=include_appreciation_as_reduction,
+
+        agi_usd=agi_usd,
+        itemized_deductions_usd=itemized_deductions_usd,
+    )
+
+
+def loan_cache_key(property_loan: IncomeAdjustedPropertyLoan) -> tuple:
+    return (
+        property_loan.purchase_price,
+        property_loan.down_payment_percentage,
+        property_loan.interest_rate_percentage,
+        property_loan.mortgage_years,
+        property_loan.property_taxes_yearly_usd,
+        property_loan.home_appreciation_percentage,
+        property_loan.include_appreciation_as_reduction,
+        property_loan.agi_usd,
+        property_loan.itemized_deductions_usd,
+    )
+
+
+@st.cache_data(ttl=3600, max_entries=64)
+def build_schedule(
+        purchase_price,
+        down_payment_percentage,
+        interest_rate_percentage,
+        mortgage_years,
+        property_taxes_yearly_usd,
+        home_appreciation_percentage,
+        include_appreciation_as_reduction,
+        agi_usd,
+        itemized_deductions_usd,
+) -> tuple[pd.DataFrame, pd.DataFrame, float, float, float]:
+    property_loan = build_property_loan(
+        purchase_price,
+        down_payment_percentage,
+        interest_rate_percentage,
+        mortgage_years,
+        property_taxes_yearly_usd,
+        home_appreciation_percentage,
+        include_appreciation_as_reduction,
+        agi_usd,
+        itemized_deductions_usd,
+    )
+    return (
+        property_loan.dataframe,
+        property_loan.dataframe_yearly,
+        property_loan.loan_amount_usd,
+        property_loan.mortgage_per_month_usd,
+        property_loan.total_interest,
+    )
+
+
+@st.cache_resource(
+    ttl=3600,
+    max_entries=64,
+    hash_funcs={IncomeAdjustedPropertyLoan: loan_cache_key},
+)
+def build_yearly_figure(property_loan: IncomeAdjustedPropertyLoan) -> go.Figure:
+    return property_loan.graph_yearly()
+
+
+@st.cache_resource(ttl=3600, max_entries=64)
+def build_monthly_figure(
+        purchase_price,
+        down_payment_percentage,
+        interest_rate_percentage,
+        mortgage_years,
+        property_taxes_yearly_usd,
+) -> go.Figure:
+    property_loan = PropertyLoan(
+        purchase_price=purchase_price,
+        down_payment_percentage=down_payment_percentage,
+        interest_rate_percentage=interest_rate_percentage,
+        mortgage_years=mortgage_years,
+        property_taxes_yearly_usd=property_taxes_yearly_usd,
+        home_appreciation_percentage=0.0,
+    )
+    return property_loan.graph_monthly()
 
 
 def populate_mortgage_container(container):
@@ -103,26 +204,42 @@ if __name__ == '__main__':
             itemized_deductions_usd
         ) = populate_taxes_container(taxes_tab)
 
-    property_loan = IncomeAdjustedPropertyLoan(
-        purchase_price=purchase_price,
-        down_payment_percentage=down_payment_percentage,
-        interest_rate_percentage=interest_rate_percentage,
-        mortgage_years=mortgage_years,
-        property_taxes_yearly_usd=purchase_price * property_tax_percentage,
-        home_appreciation_percentage=home_appreciation_percentage,
-        include_appreciation_as_reduction=include_appreciation_as_reduction,
+    loan_inputs = (
+        purchase_price,
+        down_payment_percentage,
+        interest_rate_percentage,
+        mortgage_years,
+        purchase_price * property_tax_percentage,
+        home_appreciation_percentage,
+        include_appreciation_as_reduction,
+        agi_usd,
+        itemized_deductions_usd,
+    )
 
-        agi_usd=agi_usd,
-        itemized_deductions_usd=itemized_deductions_usd,
+    (
+        dataframe,
+        dataframe_yearly,
+        loan_amount_usd,
+        mortgage_per_month_usd,
+        total_interest,
+    ) = build_schedule(*loan_inputs)
+
+    graph_yearly = build_yearly_figure(build_property_loan(*loan_inputs))
+    graph_monthly = build_monthly_figure(
+        purchase_price,
+        down_payment_percentage,
+        interest_rate_percentage,
+        mortgage_years,
+        purchase_price * property_tax_percentage,
     )
 
     st.markdown("---")
 
-    st.markdown(f"Loan Amount: {property_loan.loan_amount_usd}")
-    st.markdown(f"Monthly Payment: {property_loan.mortgage_per_month_usd}")
-    st.markdown(f"Total Interest Paid: {property_loan.total_interest}")
+    st.markdown(f"Loan Amount: {loan_amount_usd}")
+    st.markdown(f"Monthly Payment: {mortgage_per_month_usd}")
+    st.markdown(f"Total Interest Paid: {total_interest}")
 
     st.markdown("---")
 
-    st.write(property_loan.graph_yearly())
-    st.write(property_loan.graph_monthly())
+    st.write(graph_yearly)
+    st.write(graph_monthly)